@@ -19,64 +19,64 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are sets of normalized emails)
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     # Sports related activities
     "Soccer Team": {
         "description": "Join the school soccer team and compete in matches",
         "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 18,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
+        "participants": {"lucas@mergington.edu", "mia@mergington.edu"}
     },
     "Basketball Club": {
         "description": "Practice basketball skills and play friendly games",
         "schedule": "Mondays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["ethan@mergington.edu", "ava@mergington.edu"]
+        "participants": {"ethan@mergington.edu", "ava@mergington.edu"}
     },
     # Artistic activities
     "Art Workshop": {
         "description": "Explore painting, drawing, and sculpture techniques",
         "schedule": "Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["isabella@mergington.edu", "liam@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "liam@mergington.edu"}
     },
     "Drama Club": {
         "description": "Act, direct, and produce school plays and performances",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["noah@mergington.edu", "charlotte@mergington.edu"]
+        "participants": {"noah@mergington.edu", "charlotte@mergington.edu"}
     },
     # Intellectual activities
     "Math Olympiad": {
         "description": "Prepare for math competitions and solve challenging problems",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 10,
-        "participants": ["benjamin@mergington.edu", "amelia@mergington.edu"]
+        "participants": {"benjamin@mergington.edu", "amelia@mergington.edu"}
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["elijah@mergington.edu", "harper@mergington.edu"]
+        "participants": {"elijah@mergington.edu", "harper@mergington.edu"}
     }
 }
 
@@ -88,7 +88,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; serialize them as sorted lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +107,7 @@ def signup_for_activity(activity_name: str, email: str):
 
     # Normalize email and validate student is not already signed up
     normalized_email = email.strip().lower()
-    if normalized_email in (p.lower() for p in activity["participants"]):
+    if normalized_email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student is already signed up")
 
     # Check capacity
@@ -111,7 +115,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Activity is full")
 
     # Add student
-    activity["participants"].append(normalized_email)
+    activity["participants"].add(normalized_email)
     return {"message": f"Signed up {normalized_email} for {activity_name}"}
 
 
@@ -127,12 +131,11 @@ def unregister_from_activity(activity_name: str, email: str):
 
     # Normalize email for comparison
     normalized_email = email.strip().lower()
-    
-    # Find and remove the participant (case-insensitive)
-    for i, participant in enumerate(activity["participants"]):
-        if participant.lower() == normalized_email:
-            activity["participants"].pop(i)
-            return {"message": f"Unregistered {normalized_email} from {activity_name}"}
-    
-    # Participant not found
-    raise HTTPException(status_code=404, detail="Participant not found in this activity")
+
+    # Validate participant is signed up
+    if normalized_email not in activity["participants"]:
+        raise HTTPException(status_code=404, detail="Participant not found in this activity")
+
+    # Remove the participant
+    activity["participants"].remove(normalized_email)
+    return {"message": f"Unregistered {normalized_email} from {activity_name}"}
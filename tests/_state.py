@@ -0,0 +1,147 @@
+"""
+Tracked in-memory activities state shared by the test suite
+"""
+
+import pickle
+
+
+class TrackingDict(dict):
+    """Dict that records every activity a test reads or writes.
+
+    The endpoints mutate activities through ``activities[name]``, so any key
+    handed out or changed by a single-key method is treated as dirty. Methods
+    that touch entries in bulk (iteration, ``items``, ``values``, ``update``,
+    ``clear`` and friends) mark the whole dict dirty instead. Keys never
+    touched are still pristine and can be skipped when restoring.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._dirty = set()
+        self._all_dirty = False
+
+    def __getitem__(self, key):
+        self._dirty.add(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._dirty.add(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._dirty.add(key)
+        super().__delitem__(key)
+
+    def get(self, key, default=None):
+        self._dirty.add(key)
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self._dirty.add(key)
+        return super().setdefault(key, default)
+
+    def pop(self, key, *args):
+        self._dirty.add(key)
+        return super().pop(key, *args)
+
+    def _mark_all_dirty(self):
+        self._all_dirty = True
+
+    # dict(d), {**d} and {} | d copy a plain dict through a C fast path that
+    # bypasses every method below; overriding __iter__ and keys forces the
+    # slow path, which goes through the tracked methods
+    def __iter__(self):
+        self._mark_all_dirty()
+        return super().__iter__()
+
+    def keys(self):
+        self._mark_all_dirty()
+        return super().keys()
+
+    def popitem(self):
+        self._mark_all_dirty()
+        return super().popitem()
+
+    def update(self, *args, **kwargs):
+        self._mark_all_dirty()
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        self._mark_all_dirty()
+        super().clear()
+
+    def items(self):
+        self._mark_all_dirty()
+        return super().items()
+
+    def values(self):
+        self._mark_all_dirty()
+        return super().values()
+
+    def copy(self):
+        self._mark_all_dirty()
+        return super().copy()
+
+    def __or__(self, other):
+        self._mark_all_dirty()
+        return super().__or__(other)
+
+    def __ror__(self, other):
+        self._mark_all_dirty()
+        return super().__ror__(other)
+
+    def __ior__(self, other):
+        self._mark_all_dirty()
+        return super().__ior__(other)
+
+    def restore(self, seed_blobs):
+        """Restore the dirty keys (or everything) from the pickled seed entries"""
+        if self._all_dirty:
+            super().clear()
+            for key, blob in seed_blobs.items():
+                super().__setitem__(key, pickle.loads(blob))
+        else:
+            for key in self._dirty:
+                if key in seed_blobs:
+                    super().__setitem__(key, pickle.loads(seed_blobs[key]))
+                else:
+                    super().pop(key, None)
+        self._dirty.clear()
+        self._all_dirty = False
+
+
+# Canonical state that reset_activities restores after each test
+INITIAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    }
+}
+
+# Serialized once per activity so a reset is a C-level unpickle of only the
+# entries a test touched
+SEED_BLOBS = {
+    name: pickle.dumps(details, protocol=pickle.HIGHEST_PROTOCOL)
+    for name, details in INITIAL_ACTIVITIES.items()
+}
+
+
+def tracked_seed():
+    """Return a fresh TrackingDict holding a copy of the seed"""
+    return TrackingDict(
+        (name, pickle.loads(blob)) for name, blob in SEED_BLOBS.items()
+    )
@@ -0,0 +1,49 @@
+"""
+Shared pytest configuration for the Mergington High School API tests
+"""
+
+import json
+
+import httpx
+import orjson
+import pytest
+import src.app as app_module
+from tests._state import SEED_BLOBS, tracked_seed
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+if uvloop is not None:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests and fixtures on uvloop's libuv-based event loop"""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+# Swap the app's in-memory database for a tracking copy of the seed; the
+# endpoints look up the module global on every call
+activities = app_module.activities = tracked_seed()
+
+
+@pytest.fixture(autouse=True)
+def reset_activities():
+    """Restore the activities a test touched once it finishes"""
+    yield
+    activities.restore(SEED_BLOBS)
+
+
+def _orjson_response_json(self, **kwargs):
+    """Decode the body with orjson, falling back to json.loads for kwargs"""
+    if kwargs:
+        return json.loads(self.content, **kwargs)
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def orjson_responses():
+    """Decode test client response bodies with orjson instead of stdlib json"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _orjson_response_json)
+        yield
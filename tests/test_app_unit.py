@@ -0,0 +1,86 @@
+"""
+Unit tests for the Mergington High School API route handlers
+
+These call the handler functions directly, skipping routing, middleware and
+response rendering. The HTTP layer is covered by test_app.py.
+"""
+
+import pytest
+from fastapi import HTTPException
+from src.app import (
+    activities,
+    get_activities,
+    signup_for_activity,
+    unregister_from_activity,
+)
+
+
+class TestGetActivities:
+    """Unit tests for get_activities"""
+
+    def test_returns_all_activities(self):
+        """Test that every seeded activity is returned"""
+        data = get_activities()
+        assert set(data) == {"Chess Club", "Programming Class", "Gym Class"}
+
+
+class TestSignupForActivity:
+    """Unit tests for signup_for_activity"""
+
+    def test_successful_signup(self):
+        """Test that a new student is added to the activity"""
+        result = signup_for_activity("Chess Club", "alice@mergington.edu")
+        assert "alice@mergington.edu" in result["message"]
+        assert "alice@mergington.edu" in activities["Chess Club"]["participants"]
+
+    def test_signup_normalizes_email(self):
+        """Test that the stored email is trimmed and lowercased"""
+        signup_for_activity("Chess Club", "  ALICE@Mergington.edu ")
+        assert "alice@mergington.edu" in activities["Chess Club"]["participants"]
+
+    def test_signup_duplicate_email(self):
+        """Test that a duplicate signup raises a 400"""
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Chess Club", "MICHAEL@mergington.edu")
+        assert exc_info.value.status_code == 400
+
+    def test_signup_nonexistent_activity(self):
+        """Test that an unknown activity raises a 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Nonexistent Activity", "test@mergington.edu")
+        assert exc_info.value.status_code == 404
+
+    def test_signup_activity_full(self):
+        """Test that a full activity raises a 400"""
+        activities["Gym Class"]["max_participants"] = 2
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Gym Class", "new@mergington.edu")
+        assert exc_info.value.status_code == 400
+        assert "full" in exc_info.value.detail.lower()
+
+
+class TestUnregisterFromActivity:
+    """Unit tests for unregister_from_activity"""
+
+    def test_successful_unregister(self):
+        """Test that an existing participant is removed"""
+        result = unregister_from_activity("Chess Club", "michael@mergington.edu")
+        assert "Unregistered" in result["message"]
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
+
+    def test_unregister_normalizes_email(self):
+        """Test that unregister matches emails case-insensitively"""
+        unregister_from_activity("Chess Club", "MICHAEL@MERGINGTON.EDU")
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
+
+    def test_unregister_nonexistent_participant(self):
+        """Test that removing a non-participant raises a 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Chess Club", "notreal@mergington.edu")
+        assert exc_info.value.status_code == 404
+
+    def test_unregister_nonexistent_activity(self):
+        """Test that an unknown activity raises a 404"""
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Nonexistent Activity", "someone@mergington.edu")
+        assert exc_info.value.status_code == 404
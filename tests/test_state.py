@@ -0,0 +1,79 @@
+"""
+Tests for the tracked activities state used to reset the suite
+"""
+
+import pytest
+from tests._state import INITIAL_ACTIVITIES, SEED_BLOBS, tracked_seed
+
+
+def _close_all_via_values(activities):
+    for details in activities.values():
+        details["max_participants"] = 0
+
+
+def _close_all_via_items(activities):
+    for _, details in activities.items():
+        details["max_participants"] = 0
+
+
+def _close_all_via_copy(activities):
+    for details in activities.copy().values():
+        details["max_participants"] = 0
+
+
+def _replace_via_update(activities):
+    activities.update({"Chess Club": {}})
+
+
+def _close_via_or(activities):
+    (activities | {})["Chess Club"]["max_participants"] = 0
+
+
+def _replace_via_ior(activities):
+    activities |= {"Chess Club": {}}
+
+
+def _close_via_dict_constructor(activities):
+    dict(activities)["Chess Club"]["max_participants"] = 0
+
+
+def _close_via_unpacking(activities):
+    {**activities}["Chess Club"]["max_participants"] = 0
+
+
+def _close_via_ror(activities):
+    ({} | activities)["Chess Club"]["max_participants"] = 0
+
+
+class TestTrackingDictRestore:
+    """Tests for TrackingDict.restore"""
+
+    def test_restore_after_pop_and_get(self):
+        """Test that entries changed through pop and get are restored"""
+        activities = tracked_seed()
+        activities.pop("Chess Club")
+        activities.get("Gym Class")["max_participants"] = 0
+
+        activities.restore(SEED_BLOBS)
+
+        assert activities == INITIAL_ACTIVITIES
+
+    @pytest.mark.parametrize("mutate", [
+        _close_all_via_values,
+        _close_all_via_items,
+        _close_all_via_copy,
+        _replace_via_update,
+        _close_via_or,
+        _replace_via_ior,
+        _close_via_dict_constructor,
+        _close_via_unpacking,
+        _close_via_ror,
+    ])
+    def test_restore_after_bulk_access(self, mutate):
+        """Test that entries escaping through bulk access are restored"""
+        activities = tracked_seed()
+        mutate(activities)
+
+        activities.restore(SEED_BLOBS)
+
+        assert activities == INITIAL_ACTIVITIES